@@ -31,6 +31,9 @@ class BucketIRRBB:
         "> 20Y"
     ]
 
+    # Full label set: day-based first bucket, then the month buckets
+    LABELS = ["≤ 1 bulan"] + MONTH_LABELS
+
     def __init__(self, start_date, end_date):
         self.start_date = pd.to_datetime(start_date)
         self.end_date = pd.to_datetime(end_date)
@@ -49,19 +52,8 @@ class BucketIRRBB:
 
     # ---------- main logic ----------
     def get_bucket(self):
-        # First bucket = day-based
-        if self.days <= 30:
-            return "≤ 1 bulan"
-
-        # Rest = month-based
-        m = self.months
-
-        return pd.cut(
-            [m],
-            bins=self.MONTH_EDGES,
-            labels=self.MONTH_LABELS
-        )[0]
-        
+        return self.LABELS[int(irrbb_bucket_idx(self.months, self.days))]
+
 class BucketLCR:
 
     LABELS = ["≤30D", ">30D"]
@@ -75,9 +67,7 @@ class BucketLCR:
         return (self.end_date - self.reporting_date).days
 
     def get_bucket(self):
-        if self.days <= 30:
-            return "≤30D"
-        return ">30D"
+        return self.LABELS[int(lcr_bucket_idx(self.days))]
     
     
 class BucketNSFR:
@@ -96,11 +86,34 @@ class BucketNSFR:
         )
 
     def get_bucket(self):
-        m = self.months
-
-        if m < 6:
-            return "<6M"
-        elif m <= 12:
-            return "6-12M"
-        else:
-            return ">12M"
\ No newline at end of file
+        return self.LABELS[int(nsfr_bucket_idx(self.months))]
+
+
+# ---------- vectorized bucket indices ----------
+# Each takes scalars or arrays and returns int8 positions into the
+# matching class's LABELS, so callers can aggregate in integer space and
+# only turn codes into labels when presenting results.
+
+_IRRBB_EDGES = np.array(BucketIRRBB.MONTH_EDGES, dtype=float)
+
+
+def irrbb_bucket_idx(months, days):
+
+    # Month bins are right-closed, so a month count equal to an edge
+    # belongs to the bucket ending at that edge; the first bin also takes
+    # its lower edge, hence the floor at 1 (0 is the ≤30 day bucket).
+    idx = np.maximum(
+        np.searchsorted(_IRRBB_EDGES, np.asarray(months), side="left"),
+        1
+    )
+
+    return np.where(np.asarray(days) <= 30, 0, idx).astype(np.int8)
+
+
+def lcr_bucket_idx(days):
+    return (np.asarray(days) > 30).astype(np.int8)
+
+
+def nsfr_bucket_idx(months):
+    months = np.asarray(months)
+    return np.where(months < 6, 0, np.where(months <= 12, 1, 2)).astype(np.int8)
\ No newline at end of file
@@ -1,14 +1,143 @@
-import numpy_financial as npf
 import pandas as pd
 import numpy as np
-import calendar
+from typing import NamedTuple
+from numba import njit, prange
 from model import Loan
-from bucket import BucketIRRBB, BucketLCR, BucketNSFR
+from bucket import (
+    BucketIRRBB, BucketLCR, BucketNSFR,
+    irrbb_bucket_idx, lcr_bucket_idx, nsfr_bucket_idx
+)
+
+
+@njit(cache=True)
+def _pmt(r, n, pv):
+    # Level annuity payment (numpy_financial.pmt without the array dispatch)
+    return pv / n if r == 0 else pv * r / (1 - (1 + r) ** -n)
+
+
+def _round2(arr):
+    # Cent rounding with the semantics of per-value round(x, 2). np.round
+    # scales by 100 first, which can push a value next to a half-cent tie
+    # onto the wrong side, so those few fall back to the builtin.
+    arr = np.asarray(arr, dtype=float)
+    out = np.round(arr, 2)
+
+    scaled = arr * 100
+    tol = 8 * np.finfo(float).eps * np.abs(scaled) + 1e-9
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) <= tol
+
+    for i in np.flatnonzero(near_tie):
+        out[i] = round(float(arr[i]), 2)
+
+    return out
+
+
+# -------------------------
+# Schedule kernels
+# -------------------------
+# Per-period principal / interest / remaining balance for one loan.
+# Compiled once and cached on disk, so only the first import pays for JIT.
+
+@njit(cache=True)
+def _bullet_schedule(principal, r, periods):
+
+    principal_arr = np.zeros(periods)
+    interest_arr = np.full(periods, principal * r)
+    balance_arr = np.full(periods, principal)
+
+    # Principal only paid at final period
+    principal_arr[periods - 1] = principal
+    balance_arr[periods - 1] = 0.0
+
+    return principal_arr, interest_arr, balance_arr
+
+
+@njit(cache=True)
+def _annuity_schedule(principal, r, periods, pmt):
+
+    # Balance after k payments in closed form, so no period depends on the
+    # previous one: B_k = P(1+r)^k - pmt((1+r)^k - 1) / r
+    k = np.arange(periods + 1).astype(np.float64)
+
+    if r == 0:
+        balance = principal - pmt * k
+    else:
+        growth = (1 + r) ** k
+        balance = principal * growth - pmt * (growth - 1) / r
+
+    interest_arr = balance[:-1] * r
+    principal_arr = pmt - interest_arr
+
+    return principal_arr, interest_arr, balance[1:]
+
+
+@njit(cache=True)
+def _flat_schedule(principal, r, periods):
+
+    monthly_principal = principal / periods
+
+    principal_arr = np.full(periods, monthly_principal)
+    interest_arr = np.full(periods, principal * r)
+
+    # Straight-line balance after k payments, closed form like the annuity
+    balance_arr = principal - monthly_principal * np.arange(1, periods + 1)
+
+    return principal_arr, interest_arr, balance_arr
+
+
+# Schedule kinds for the batch kernel (plain ints keep it in nopython mode)
+_BULLET, _ANNUITY, _FLAT = 0, 1, 2
+
+
+@njit(parallel=True, cache=True)
+def _schedule_batch_kernel(outstanding, r, periods, offsets, kind):
+
+    total = offsets[-1] + periods[-1] if len(periods) else 0
+
+    principal_arr = np.empty(total)
+    interest_arr = np.empty(total)
+
+    # Loans are independent: each one fills its own slice of the flat arrays
+    for i in prange(len(periods)):
+
+        n = periods[i]
+        if n == 0:
+            continue
+
+        if kind[i] == _BULLET:
+            p, it, _ = _bullet_schedule(outstanding[i], r[i], n)
+        elif kind[i] == _ANNUITY:
+            p, it, _ = _annuity_schedule(outstanding[i], r[i], n, _pmt(r[i], n, outstanding[i]))
+        else:
+            p, it, _ = _flat_schedule(outstanding[i], r[i], n)
+
+        start = offsets[i]
+        principal_arr[start:start + n] = p
+        interest_arr[start:start + n] = it
+
+    return principal_arr, interest_arr
+
+
+class Schedule(NamedTuple):
+    """Per-period schedule columns (rounded to 2 decimals) as numpy arrays."""
+
+    payment_date: np.ndarray
+    payment: np.ndarray
+    principal: np.ndarray
+    interest: np.ndarray
+    remaining_balance: np.ndarray
+
+    @property
+    def empty(self):
+        return len(self.payment_date) == 0
+
 
 class Amortization:
 
     def __init__(self, loan: Loan):
         self.loan = loan
+        self._schedule_cache = None
+        self._bucket_cache = {}
 
     # Payment dates generator
     def generate_payment_dates(self, reporting_date, end_date):
@@ -17,65 +146,55 @@ class Amortization:
 
         anchor_day = end_date.day
 
-        # Determine first month/year to start
-        year = reporting_date.year
-        month = reporting_date.month
+        # Determine first month to start
+        first_month = pd.Timestamp(year=reporting_date.year, month=reporting_date.month, day=1)
 
         # Move to next month if needed
         if reporting_date.day >= anchor_day:
-            month += 1
-            if month > 12:
-                month = 1
-                year += 1
-
-        dates = []
-
-        while True:
-            # Get last day of current month
-            last_day = calendar.monthrange(year, month)[1]
+            first_month += pd.offsets.MonthBegin(1)
 
-            # Clamp only for that month
-            day = min(anchor_day, last_day)
-
-            d = pd.Timestamp(year=year, month=month, day=day)
-
-            if d > end_date:
-                break
+        # The end month always holds the last date (its anchor is end_date itself)
+        periods = max(
+            (end_date.year - first_month.year) * 12 + (end_date.month - first_month.month) + 1,
+            0
+        )
 
-            dates.append(d)
+        anchors = pd.date_range(first_month, periods=periods, freq="MS")
 
-            # Move to next month manually
-            month += 1
-            if month > 12:
-                month = 1
-                year += 1
+        # Clamp the anchor day to each month's length
+        day = np.minimum(anchor_day, anchors.days_in_month.to_numpy())
 
-        return dates
+        return anchors + pd.to_timedelta(day - 1, unit="D")
 
     def _empty_bucket_result(self, bucket_type="irrbb"):
 
         if bucket_type == "irrbb":
-            labels = ["≤ 1 bulan"] + BucketIRRBB.MONTH_LABELS
+            labels = BucketIRRBB.LABELS
 
         elif bucket_type == "lcr":
-            labels = ["≤30D", ">30D"]
+            labels = BucketLCR.LABELS
 
         elif bucket_type == "nsfr":
-            labels = ["<6M", "6-12M", ">12M"]
+            labels = BucketNSFR.LABELS
 
         else:
             raise ValueError("Unknown bucket_type")
 
-        return pd.DataFrame({
-            "bucket": labels,
-            "value": [0]*len(labels)
-        })
+        return _bucket_result(labels, [0]*len(labels))
 
     # -------------------------
     # Schedule
     # -------------------------
     def schedule(self):
 
+        # Independent of value_type, so every bucket call shares one build
+        if self._schedule_cache is None:
+            self._schedule_cache = self._build_schedule()
+
+        return self._schedule_cache
+
+    def _build_schedule(self):
+
         principal = self.loan.outstanding
         annual_rate = self.loan.interest_rate
         method = self.loan.method.lower()
@@ -87,92 +206,38 @@ class Amortization:
         payment_dates = self.generate_payment_dates(reporting_date, end_date)
         periods = len(payment_dates)
 
-        if end_date <= reporting_date:
-            return pd.DataFrame()
-        
-        # if periods <= 0:
-        #     raise ValueError("No payment periods found")
-
-        rows = []
+        if end_date <= reporting_date or periods == 0:
+            return Schedule(np.empty(0, dtype="datetime64[ns]"), *(np.empty(0) for _ in range(4)))
 
         r = annual_rate / 12
-        balance = principal
+        principal = float(principal)
 
         # =====================================
         # INSTALLMENT = NO (Bullet structure)
         # =====================================
         if installment == "no":
 
-            monthly_interest = principal * r
-
-            for i, pay_date in enumerate(payment_dates, start=1):
-
-                # Principal only paid at final period
-                if i == periods:
-                    principal_payment = principal
-                else:
-                    principal_payment = 0
-
-                interest = monthly_interest
-                payment = principal_payment + interest
-
-                balance -= principal_payment
-
-                rows.append({
-                    "period": i,
-                    "payment_date": pay_date,
-                    "payment": round(payment, 2),
-                    "principal": round(principal_payment, 2),
-                    "interest": round(interest, 2),
-                    "remaining_balance": round(max(balance, 0), 2)
-                })
-
-            return pd.DataFrame(rows)
+            principal_arr, interest_arr, balance_arr = _bullet_schedule(principal, r, periods)
+            payment_arr = principal_arr + interest_arr
 
         # =====================================
         # INSTALLMENT = YES (Normal loans)
         # =====================================
-        if installment == "yes":
+        elif installment == "yes":
 
             # ===== ANNUITY =====
             if method == "annuity":
 
-                pmt = npf.pmt(r, periods, -principal) if r != 0 else principal / periods
+                pmt = _pmt(r, periods, principal)
 
-                for i, pay_date in enumerate(payment_dates, start=1):
-
-                    interest = balance * r
-                    principal_payment = pmt - interest
-                    balance -= principal_payment
-
-                    rows.append({
-                        "period": i,
-                        "payment_date": pay_date,
-                        "payment": round(pmt, 2),
-                        "principal": round(principal_payment, 2),
-                        "interest": round(interest, 2),
-                        "remaining_balance": round(max(balance, 0), 2)
-                    })
+                principal_arr, interest_arr, balance_arr = _annuity_schedule(principal, r, periods, pmt)
+                payment_arr = np.full(periods, pmt)
 
             # ===== FLAT =====
             elif method == "flat":
 
-                monthly_principal = principal / periods
-                monthly_interest = principal * r
-                payment = monthly_principal + monthly_interest
-
-                for i, pay_date in enumerate(payment_dates, start=1):
-
-                    balance -= monthly_principal
-
-                    rows.append({
-                        "period": i,
-                        "payment_date": pay_date,
-                        "payment": round(payment, 2),
-                        "principal": round(monthly_principal, 2),
-                        "interest": round(monthly_interest, 2),
-                        "remaining_balance": round(max(balance, 0), 2)
-                    })
+                principal_arr, interest_arr, balance_arr = _flat_schedule(principal, r, periods)
+                payment_arr = principal_arr + interest_arr
 
             else:
                 raise ValueError("method must be 'annuity' or 'flat'")
@@ -180,316 +245,363 @@ class Amortization:
         else:
             raise ValueError("installment must be 'yes' or 'no'")
 
-        return pd.DataFrame(rows)
+        return Schedule(
+            payment_date=payment_dates.to_numpy(dtype="datetime64[ns]"),
+            payment=_round2(payment_arr),
+            principal=_round2(principal_arr),
+            interest=_round2(interest_arr),
+            remaining_balance=_round2(np.maximum(balance_arr, 0))
+        )
+
+    # DataFrame view of schedule(), for callers outside the bucket methods
+    def schedule_df(self):
+
+        sched = self.schedule()
+        if sched.empty:
+            return pd.DataFrame()
 
+        return pd.DataFrame({
+            "period": np.arange(1, len(sched.payment_date) + 1),
+            **sched._asdict()
+        })
 
 
     # -------------------------
-    # BUCKET - IRRBB
+    # Bucket indices (shared by every bucket method)
     # -------------------------
-    def get_bucket_irrbb(self, value_type="total"):
+    # Bucket positions depend only on payment dates, not on value_type, so
+    # they are computed once per loan and reused by all six bucket methods.
+    def _bucket_indices(self):
 
-        sched = self.schedule()
-        if sched is None or sched.empty:
-            return self._empty_bucket_result("irrbb")
-        df = sched.copy()
-        
-        reporting_date = self.loan.reporting_date
+        if not self._bucket_cache:
 
-        # -------------------------
-        # Time differences
-        # -------------------------
-        df["days"] = (df["payment_date"] - reporting_date).dt.days
+            sched = self.schedule()
+            reporting_date = self.loan.reporting_date
 
-        df["months"] = (
-            (df["payment_date"].dt.year - reporting_date.year) * 12 +
-            (df["payment_date"].dt.month - reporting_date.month)
-        )
+            days = _day_diff(sched.payment_date, reporting_date)
+            months = _month_diff(sched.payment_date, reporting_date)
 
-        # -------------------------
-        # Bucket logic
-        # -------------------------
-        df["bucket"] = None
+            self._bucket_cache = {
+                "days": days,
+                "irrbb": irrbb_bucket_idx(months, days),
+                "lcr": lcr_bucket_idx(days),
+                "nsfr": nsfr_bucket_idx(months)
+            }
+
+        return self._bucket_cache
 
-        # ≤30 days
-        mask_1m = df["days"] <= 30
-        df.loc[mask_1m, "bucket"] = "≤ 1 bulan"
+    # -------------------------
+    # BUCKET - IRRBB
+    # -------------------------
+    def get_bucket_irrbb(self, value_type="total"):
 
-        # >30 days → month buckets
-        df.loc[~mask_1m, "bucket"] = pd.cut(
-            df.loc[~mask_1m, "months"],
-            bins=BucketIRRBB.MONTH_EDGES,
-            labels=BucketIRRBB.MONTH_LABELS,
-            right=True,
-            include_lowest=True
-        ).astype(str)
+        sched = self.schedule()
+        if sched.empty:
+            return self._empty_bucket_result("irrbb")
 
         # -------------------------
         # Value selection
         # -------------------------
-        if value_type == "principal":
-            df["value"] = df["principal"]
-        elif value_type == "interest":
-            df["value"] = df["interest"]
-        else:
-            df["value"] = df["principal"] + df["interest"]
+        value = _select_value(sched.principal, sched.interest, value_type)
 
         # -------------------------
         # Aggregation
         # -------------------------
-        all_labels = ["≤ 1 bulan"] + BucketIRRBB.MONTH_LABELS
-
-        result = (
-            df.groupby("bucket", observed=True)["value"]
-            .sum()
-            .reindex(all_labels, fill_value=0)
-            .reset_index()
+        return _bucket_result(
+            BucketIRRBB.LABELS,
+            np.bincount(self._bucket_indices()["irrbb"], weights=value, minlength=len(BucketIRRBB.LABELS))
         )
 
-        return result
-    
     # -------------------------
     # BUCKET - LCR
     # -------------------------
     def get_bucket_lcr(self, value_type="total"):
 
         sched = self.schedule()
-        if sched is None or sched.empty:
+        if sched.empty:
             return self._empty_bucket_result("lcr")
-        df = sched.copy()
-        
-        reporting_date = self.loan.reporting_date
-
-        # -------------------------
-        # Day difference
-        # -------------------------
-        df["days"] = (df["payment_date"] - reporting_date).dt.days
-
-        # -------------------------
-        # Bucket logic
-        # -------------------------
-        df["bucket"] = np.where(
-            df["days"] <= 30,
-            "≤30D",
-            ">30D"
-        )
 
         # -------------------------
         # Value selection
         # -------------------------
-        if value_type == "principal":
-            df["value"] = df["principal"]
-        elif value_type == "interest":
-            df["value"] = df["interest"]
-        else:
-            df["value"] = df["principal"] + df["interest"]
+        value = _select_value(sched.principal, sched.interest, value_type)
 
         # -------------------------
         # Aggregation
         # -------------------------
-        labels = ["≤30D", ">30D"]
-
-        result = (
-            df.groupby("bucket")["value"]
-            .sum()
-            .reindex(labels, fill_value=0)
-            .reset_index()
+        return _bucket_result(
+            BucketLCR.LABELS,
+            np.bincount(self._bucket_indices()["lcr"], weights=value, minlength=len(BucketLCR.LABELS))
         )
 
-        return result
-    
     # -------------------------
     # BUCKET - NSFR
     # -------------------------
     def get_bucket_nsfr(self, value_type="total"):
 
         sched = self.schedule()
-        if sched is None or sched.empty:
+        if sched.empty:
             return self._empty_bucket_result("nsfr")
-        df = sched.copy()
-        
-        reporting_date = self.loan.reporting_date
-
-        # -------------------------
-        # Month difference
-        # -------------------------
-        df["months"] = (
-            (df["payment_date"].dt.year - reporting_date.year) * 12 +
-            (df["payment_date"].dt.month - reporting_date.month)
-        )
-
-        # -------------------------
-        # Bucket logic
-        # -------------------------
-        conditions = [
-            df["months"] < 6,
-            (df["months"] >= 6) & (df["months"] <= 12),
-            df["months"] > 12
-        ]
-
-        choices = ["<6M", "6-12M", ">12M"]
-
-        df["bucket"] = np.select(
-            conditions,
-            choices,
-            default=">12M"
-        )
 
         # -------------------------
         # Value selection
         # -------------------------
-        if value_type == "principal":
-            df["value"] = df["principal"]
-        elif value_type == "interest":
-            df["value"] = df["interest"]
-        else:
-            df["value"] = df["principal"] + df["interest"]
+        value = _select_value(sched.principal, sched.interest, value_type)
 
         # -------------------------
         # Aggregation
         # -------------------------
-        result = (
-            df.groupby("bucket")["value"]
-            .sum()
-            .reindex(choices, fill_value=0)
-            .reset_index()
+        return _bucket_result(
+            BucketNSFR.LABELS,
+            np.bincount(self._bucket_indices()["nsfr"], weights=value, minlength=len(BucketNSFR.LABELS))
         )
 
-        return result
-    
-    
-    # Flattened bucket IRRBB
-    def get_bucket_irrbb_flat(self, value_type="total"):
+
+    # -------------------------
+    # Flat bucket vectors
+    # -------------------------
+    # One float per label, in label order. The *_flat methods wrap these
+    # in a single-row DataFrame.
+    def _bucket_irrbb_array(self, value_type="total"):
 
         sched = self.schedule()
-        if sched is None or sched.empty:
-            return self._empty_bucket_result("irrbb")
-        df = sched.copy()
-        
-        reporting_date = self.loan.reporting_date
+        if sched.empty:
+            return np.zeros(len(BucketIRRBB.LABELS))
 
-        df["days"] = (df["payment_date"] - reporting_date).dt.days
+        value = _select_value(sched.principal, sched.interest, value_type)
 
-        df["months"] = (
-            (df["payment_date"].dt.year - reporting_date.year) * 12 +
-            (df["payment_date"].dt.month - reporting_date.month)
-        )
+        return np.bincount(self._bucket_indices()["irrbb"], weights=value, minlength=len(BucketIRRBB.LABELS))
 
-        # Bucket logic
-        df["bucket"] = None
+    def _bucket_lcr_array(self, value_type="total"):
 
-        mask_1m = df["days"] <= 30
-        df.loc[mask_1m, "bucket"] = "≤ 1 bulan"
+        sched = self.schedule()
+        if sched.empty:
+            return np.zeros(len(BucketLCR.LABELS))
 
-        df.loc[~mask_1m, "bucket"] = pd.cut(
-            df.loc[~mask_1m, "months"],
-            bins=BucketIRRBB.MONTH_EDGES,
-            labels=BucketIRRBB.MONTH_LABELS,
-            right=True,
-            include_lowest=True
-        ).astype(str)
+        cache = self._bucket_indices()
+        value = _lcr_flat_value(sched.principal, sched.interest, cache["days"], value_type)
 
-        # Value selection
-        if value_type == "principal":
-            df["value"] = df["principal"]
-        elif value_type == "interest":
-            df["value"] = df["interest"]
-        else:
-            df["value"] = df["principal"] + df["interest"]
+        return np.bincount(cache["lcr"], weights=value, minlength=len(BucketLCR.LABELS))
 
-        all_labels = ["≤ 1 bulan"] + BucketIRRBB.MONTH_LABELS
+    def _bucket_nsfr_array(self, value_type="total"):
 
-        result = (
-            df.groupby("bucket", observed=True)["value"]
-            .sum()
-            .reindex(all_labels, fill_value=0)
-            .to_frame()
-            .T
-        )
+        sched = self.schedule()
+        if sched.empty:
+            return np.zeros(len(BucketNSFR.LABELS))
 
-        return result
+        value = _nsfr_flat_value(sched.principal, sched.interest, value_type)
 
-    # Flattened bucket LCR
-    def get_bucket_lcr_flat(self, value_type="total"):
+        return np.bincount(self._bucket_indices()["nsfr"], weights=value, minlength=len(BucketNSFR.LABELS))
 
-        sched = self.schedule()
-        if sched is None or sched.empty:
-            return self._empty_bucket_result("lcr")
+    # Flattened bucket IRRBB
+    def get_bucket_irrbb_flat(self, value_type="total"):
 
-        df = sched.copy()
-        reporting_date = self.loan.reporting_date
+        values = self._bucket_irrbb_array(value_type)
 
-        df["days"] = (df["payment_date"] - reporting_date).dt.days
-        df["bucket"] = np.where(df["days"] <= 30, "≤30D", ">30D")
-
-        if value_type == "principal":
-            df["value"] = df["principal"]
-
-        elif value_type == "interest":
-            df["value"] = np.where(
-                df["bucket"] == "≤30D",
-                df["interest"],
-                0
-            )
-
-        else:  # total
-            df["value"] = df["principal"] + np.where(
-                df["bucket"] == "≤30D",
-                df["interest"],
-                0
-            )
-
-        labels = ["≤30D", ">30D"]
-
-        result = (
-            df.groupby("bucket")["value"]
-            .sum()
-            .reindex(labels, fill_value=0)
-            .to_frame()
-            .T
-        )
+        return pd.DataFrame(values[None, :], columns=BucketIRRBB.LABELS)
+
+    # Flattened bucket LCR
+    def get_bucket_lcr_flat(self, value_type="total"):
+
+        values = self._bucket_lcr_array(value_type)
 
-        return result
+        return pd.DataFrame(values[None, :], columns=BucketLCR.LABELS)
 
     # Flattened bucket NSFR
     def get_bucket_nsfr_flat(self, value_type="total"):
 
-        sched = self.schedule()
-        if sched is None or sched.empty:
-            return self._empty_bucket_result("nsfr")
-        df = sched.copy()
-        
-        reporting_date = self.loan.reporting_date
+        values = self._bucket_nsfr_array(value_type)
 
-        df["months"] = (
-            (df["payment_date"].dt.year - reporting_date.year) * 12 +
-            (df["payment_date"].dt.month - reporting_date.month)
-        )
+        return pd.DataFrame(values[None, :], columns=BucketNSFR.LABELS)
 
-        conditions = [
-            df["months"] < 6,
-            (df["months"] >= 6) & (df["months"] <= 12),
-            df["months"] > 12
-        ]
 
-        choices = ["<6M", "6-12M", ">12M"]
+# -------------------------
+# Flat bucket helpers
+# -------------------------
+# Shared by the per-loan bucket methods and the batch path below. All
+# inputs are plain arrays; reporting_date may be a scalar Timestamp or a
+# per-row datetime64 array.
 
-        df["bucket"] = np.select(conditions, choices, default=">12M")
+def _day_diff(payment_date, reporting_date):
 
-        if value_type == "principal":
-            df["value"] = df["principal"]
-        elif value_type == "interest":
-            # df["value"] = df["interest"]
-            df["value"] = 0
-        else:
-            df["value"] = df["principal"] + df["interest"]
-
-        result = (
-            df.groupby("bucket")["value"]
-            .sum()
-            .reindex(choices, fill_value=0)
-            .to_frame()
-        .T
+    # Whole days, floored like Timedelta.days, straight off datetime64[ns]
+    payment_date = np.asarray(payment_date, dtype="datetime64[ns]")
+    reporting_date = np.asarray(reporting_date, dtype="datetime64[ns]")
+
+    return (payment_date - reporting_date) // np.timedelta64(1, "D")
+
+
+def _month_diff(payment_date, reporting_date):
+
+    # Calendar month difference: truncate both to datetime64[M] and subtract
+    payment_month = np.asarray(payment_date, dtype="datetime64[ns]").astype("datetime64[M]")
+    reporting_month = np.asarray(reporting_date, dtype="datetime64[ns]").astype("datetime64[M]")
+
+    return (payment_month - reporting_month).astype(np.int64)
+
+
+def _bucket_result(labels, values):
+
+    # Long bucket / value frame; values are already in label order
+    return pd.DataFrame({
+        "bucket": labels,
+        "value": values
+    })
+
+
+def _select_value(principal, interest, value_type):
+
+    if value_type == "principal":
+        return principal
+    elif value_type == "interest":
+        return interest
+    return principal + interest
+
+
+def _lcr_flat_value(principal, interest, days, value_type):
+
+    # Only interest falling inside the 30 day window counts
+    interest = np.where(days <= 30, interest, 0)
+
+    return _select_value(principal, interest, value_type)
+
+
+def _nsfr_flat_value(principal, interest, value_type):
+
+    if value_type == "interest":
+        return np.zeros(len(principal))
+    return _select_value(principal, interest, value_type)
+
+
+# -------------------------
+# Batch schedule (all loans at once)
+# -------------------------
+def schedule_batch(reporting_date, end_date, outstanding, interest_rate,
+                   installment, method):
+    """
+    Vectorized equivalent of Amortization.schedule() over many loans.
+
+    All arguments are equal-length arrays (installment / method already
+    lower-cased). Returns one long DataFrame with a row per payment and a
+    `loan_idx` column pointing back to the input position.
+    """
+
+    reporting_date = pd.DatetimeIndex(reporting_date)
+    end_date = pd.DatetimeIndex(end_date)
+    outstanding = np.asarray(outstanding, dtype=float)
+    r = np.asarray(interest_rate, dtype=float) / 12
+    installment = np.asarray(installment, dtype=object)
+    method = np.asarray(method, dtype=object)
+
+    n = len(reporting_date)
+
+    # -------------------------
+    # Periods (same rules as generate_payment_dates)
+    # -------------------------
+    anchor_day = end_date.day.to_numpy()
+
+    # Months counted from year 0 so the +1 roll-over needs no special case
+    first_month = (
+        reporting_date.year.to_numpy() * 12 + reporting_date.month.to_numpy() - 1 +
+        (reporting_date.day.to_numpy() >= anchor_day)
+    )
+    last_month = end_date.year.to_numpy() * 12 + end_date.month.to_numpy() - 1
+
+    periods = np.where(
+        end_date > reporting_date,
+        np.maximum(last_month - first_month + 1, 0),
+        0
     )
 
-        return result
\ No newline at end of file
+    live = periods > 0
+
+    if (live & ~np.isin(installment, ["yes", "no"])).any():
+        raise ValueError("installment must be 'yes' or 'no'")
+
+    is_annuity = live & (installment == "yes") & (method == "annuity")
+    is_flat = live & (installment == "yes") & (method == "flat")
+
+    if (live & (installment == "yes") & ~(is_annuity | is_flat)).any():
+        raise ValueError("method must be 'annuity' or 'flat'")
+
+    # -------------------------
+    # Long format index arrays
+    # -------------------------
+    offsets = np.cumsum(periods) - periods
+    loan_idx = np.repeat(np.arange(n), periods)
+    period_no = np.arange(periods.sum()) - np.repeat(offsets, periods) + 1
+
+    # Payment dates: anchor day clamped to the month length
+    month = (np.repeat(first_month, periods) + period_no - 1 - 1970 * 12).astype("datetime64[M]")
+    month_start = month.astype("datetime64[D]")
+    days_in_month = ((month + 1).astype("datetime64[D]") - month_start).astype(np.int64)
+    day = np.minimum(anchor_day[loan_idx], days_in_month)
+    payment_date = (month_start + (day - 1)).astype("datetime64[ns]")
+
+    # -------------------------
+    # Principal / interest
+    # -------------------------
+    # Same per-loan kernels as schedule(), run across loans in parallel
+    kind = np.where(installment == "no", _BULLET, np.where(is_annuity, _ANNUITY, _FLAT))
+
+    principal, interest = _schedule_batch_kernel(
+        outstanding, r, periods.astype(np.int64), offsets.astype(np.int64), kind
+    )
+
+    return pd.DataFrame({
+        "loan_idx": loan_idx,
+        "period": period_no,
+        "payment_date": payment_date,
+        "reporting_date": reporting_date.to_numpy()[loan_idx],
+        "principal": _round2(principal),
+        "interest": _round2(interest)
+    })
+
+
+def bucket_batch(sched, n_loans, value_types=("principal", "interest")):
+    """
+    Flattened LCR / NSFR / IRRBB buckets for every loan in a
+    schedule_batch() frame, for several value types in one pass.
+
+    Returns {value_type: {label: array of length n_loans}}, labels in
+    output column order. Bucket indices are computed once and shared by
+    every value type.
+    """
+
+    loan_idx = sched["loan_idx"].to_numpy()
+    payment_date = sched["payment_date"].to_numpy()
+    reporting_date = sched["reporting_date"].to_numpy()
+    principal = sched["principal"].to_numpy()
+    interest = sched["interest"].to_numpy()
+
+    days = _day_diff(payment_date, reporting_date)
+    months = _month_diff(payment_date, reporting_date)
+
+    parts = [
+        (lcr_bucket_idx(days), lambda vt: _lcr_flat_value(principal, interest, days, vt), BucketLCR.LABELS),
+        (nsfr_bucket_idx(months), lambda vt: _nsfr_flat_value(principal, interest, vt), BucketNSFR.LABELS),
+        (irrbb_bucket_idx(months, days), lambda vt: _select_value(principal, interest, vt), BucketIRRBB.LABELS),
+    ]
+
+    columns = {value_type: {} for value_type in value_types}
+
+    for bucket_idx, get_value, labels in parts:
+
+        k = len(labels)
+
+        # (loan, bucket) cell of every payment, reused for each value type
+        cell = loan_idx * k + bucket_idx
+
+        for value_type in value_types:
+
+            # One bincount per value type, reshaped to a loan x label grid
+            block = np.bincount(
+                cell,
+                weights=get_value(value_type),
+                minlength=n_loans * k
+            ).reshape(n_loans, k)
+
+            for j, label in enumerate(labels):
+                columns[value_type][label] = block[:, j]
+
+    return columns
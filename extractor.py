@@ -1,80 +1,116 @@
 import pandas as pd
-from model import Loan
-from calculator import Amortization
+import numpy as np
+from calculator import schedule_batch, bucket_batch
 
 
 class Extractor:
 
+    # Input columns the pipeline reads ("Method" is optional)
+    DATE_COLUMNS = ["Reporting Date", "End Date"]
+
+    COLUMN_DTYPES = {
+        "Outstanding": np.float64,
+        "Interest Rate": np.float64,
+        "Installment": str,
+        "Method": str
+    }
+
+    COLUMNS = ["Account ID"] + DATE_COLUMNS + list(COLUMN_DTYPES)
+
     def __init__(self, input_path, output_path, sheet_name):
         self.input_path = input_path
         self.output_path = output_path
         self.sheet_name = sheet_name
+        self.schedule = None
 
     # -------------------------
     # 1. Read Excel
     # -------------------------
     def read_data(self):
-        self.df = pd.read_excel(self.input_path, sheet_name=self.sheet_name)
+        self.df = pd.read_excel(
+            self.input_path,
+            sheet_name=self.sheet_name,
+            usecols=lambda col: col in self.COLUMNS,
+            dtype=self.COLUMN_DTYPES,
+            parse_dates=self.DATE_COLUMNS
+        )
         return self.df
 
+    # -------------------------
+    # Schedule (shared by every value_type)
+    # -------------------------
+    def _build_schedule(self):
+
+        df = self.df
+
+        installment = (
+            df["Installment"].where(df["Installment"].notna(), "no")
+            .astype(str).str.lower()
+        )
+
+        # Blank Method cells default to annuity, like a missing column
+        if "Method" in df:
+            method = df["Method"].fillna("annuity").astype(str).str.lower()
+        else:
+            method = pd.Series("annuity", index=df.index)
+
+        # One long schedule for every loan
+        return schedule_batch(
+            pd.to_datetime(df["Reporting Date"]).to_numpy(),
+            pd.to_datetime(df["End Date"]).to_numpy(),
+            df["Outstanding"].to_numpy(),
+            df["Interest Rate"].to_numpy(),
+            installment.to_numpy(),
+            method.to_numpy()
+        )
+
     # -------------------------
     # Core processor
     # -------------------------
-    def _process_amount(self, value_type):
-
-        results = []
-
-        for _, row in self.df.iterrows():
-
-            loan = Loan(
-                reporting_date=row["Reporting Date"],
-                account_id=row["Account ID"],
-                currency=row["CCY"],
-                outstanding=row["Outstanding"],
-                interest_rate=row["Interest Rate"],
-                start_date=row["Start Date"],
-                end_date=row["End Date"],
-                installment=str(row["Installment"]) if pd.notna(row["Installment"]) else "no",
-                product_type=row.get("ProductType"),
-                segment=row.get("Segment"),
-                daerah=row.get("Daerah"),
-                postal_code=row.get("KodePos"),
-                insured_or_uninsured=row.get("Insured/Uninsured"),
-                transactional_or_non_transactional=row.get("Transactional/Non Transactional"),
-                method=row.get("Method", "annuity")
-            )
+    def _process_amounts(self, value_types):
 
-            amort = Amortization(loan)
+        df = self.df
 
-            # --- get each bucket ---
-            lcr = amort.get_bucket_lcr_flat(value_type)
-            nsfr = amort.get_bucket_nsfr_flat(value_type)
-            irrbb = amort.get_bucket_irrbb_flat(value_type)
+        # Single traversal: every value type is reduced from the same
+        # schedule and the same bucket indices
+        buckets = bucket_batch(self.schedule, len(df), value_types)
 
-            remaining_days = (loan.end_date - loan.reporting_date).days
-            
-            combined = pd.concat([lcr, nsfr, irrbb], axis=1)
-            combined.insert(0, "account_id", loan.account_id)
-            combined.insert(1, "remaining_days_to_maturity", remaining_days)
-            
-            results.append(combined)
+        account_id = df["Account ID"].to_numpy()
+        remaining_days = (
+            pd.to_datetime(df["End Date"]) - pd.to_datetime(df["Reporting Date"])
+        ).dt.days.to_numpy()
 
-        return pd.concat(results, ignore_index=True)
+        # Each result built exactly once from plain column arrays
+        return {
+            value_type: pd.DataFrame({
+                "account_id": account_id,
+                "remaining_days_to_maturity": remaining_days,
+                **buckets[value_type]
+            })
+            for value_type in value_types
+        }
 
     # -------------------------
     # 2. Process loans
     # -------------------------
     def process(self):
 
-        self.principal_df = self._process_amount("principal")
-        self.interest_df = self._process_amount("interest")
+        self.schedule = self._build_schedule()
+
+        results = self._process_amounts(("principal", "interest"))
+
+        self.principal_df = results["principal"]
+        self.interest_df = results["interest"]
 
     # -------------------------
     # 3. Write Excel (2 sheets)
     # -------------------------
     def write_output(self):
 
-        with pd.ExcelWriter(self.output_path, engine="openpyxl") as writer:
+        # xlsxwriter writes the workbook faster and lighter than openpyxl.
+        # Not in constant_memory mode: pandas writes cells column by column,
+        # which that mode would silently drop.
+        with pd.ExcelWriter(self.output_path, engine="xlsxwriter") as writer:
             self.principal_df.to_excel(
                 writer,
                 sheet_name="Principal",
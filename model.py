@@ -1,5 +1,11 @@
 import pandas as pd
 
+
+def _ts(value):
+    # Already-parsed dates (e.g. from read_excel parse_dates) skip the parser
+    return value if isinstance(value, pd.Timestamp) else pd.to_datetime(value)
+
+
 class Loan:
     def __init__(
         self,
@@ -19,13 +25,13 @@ class Loan:
         insured_or_uninsured=None,
         transactional_or_non_transactional=None
     ):
-        self.reporting_date = pd.to_datetime(reporting_date)
+        self.reporting_date = _ts(reporting_date)
         self.account_id = account_id
         self.currency = currency
         self.outstanding = outstanding
         self.interest_rate = interest_rate
-        self.start_date = pd.to_datetime(start_date)
-        self.end_date = pd.to_datetime(end_date)
+        self.start_date = _ts(start_date)
+        self.end_date = _ts(end_date)
         self.installment = installment
         self.method = method
         self.product_type = product_type